@@ -4,6 +4,7 @@ PostToolUse hook: Validate marketplace.json schema after edits.
 
 Triggers: After Write|Edit tool use
 Action: Validate marketplace.json schema and report errors
+        (skipped when the edited file is not marketplace.json)
 """
 
 import json
@@ -17,6 +18,12 @@ def get_project_dir() -> str:
     return os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
 
 
+def load_marketplace(path: str) -> Any:
+    """Parse marketplace.json."""
+    with open(path, "rb") as f:
+        return json.loads(f.read())
+
+
 def validate_marketplace(data: dict[str, Any]) -> list[str]:
     """Validate marketplace.json against required schema."""
     errors = []
@@ -79,6 +86,16 @@ def validate_marketplace(data: dict[str, Any]) -> list[str]:
 
 def main():
     """Main hook entry point."""
+    try:
+        hook_input = json.loads(sys.stdin.buffer.read())
+    except Exception:
+        hook_input = {}
+
+    # Only an edit to marketplace.json can change the validation result
+    file_path = hook_input.get("tool_input", {}).get("file_path", "")
+    if file_path and os.path.basename(file_path) != "marketplace.json":
+        sys.exit(0)
+
     project_dir = get_project_dir()
     marketplace_path = os.path.join(project_dir, ".claude-plugin", "marketplace.json")
 
@@ -88,8 +105,7 @@ def main():
         sys.exit(0)
 
     try:
-        with open(marketplace_path, "r") as f:
-            data = json.load(f)
+        data = load_marketplace(marketplace_path)
     except json.JSONDecodeError as e:
         output = {
             "decision": "block",
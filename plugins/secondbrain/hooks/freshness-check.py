@@ -13,27 +13,56 @@ Exit codes:
 import json
 import os
 import sys
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
-try:
-    import yaml
-except ImportError:
-    # yaml not available, skip check
-    sys.exit(0)
+# Statuses that mean a record no longer needs attention
+EXCLUDED_STATUSES_PARTITIONED = frozenset({"archived", "completed", "done", "canceled"})
+EXCLUDED_STATUSES = frozenset({
+    "archived", "completed", "done", "canceled", "rejected", "tested", "implemented"
+})
+
+# Per-file cache of candidate records, keyed by path relative to the
+# project root and (mtime, size); local state, kept out of git
+CACHE_FILE = ".freshness-cache.json"
+
+# Touched after every full check; its mtime throttles the hook
+STAMP_FILE = ".freshness.stamp"
+CHECK_INTERVAL_SECONDS = 3600
 
 
 def find_project_root() -> Path | None:
     """Find the project root by looking for .claude/data/config.yaml"""
-    cwd = Path.cwd()
+    current = os.getcwd()
 
     # Check current directory and parents
-    for path in [cwd] + list(cwd.parents):
-        config_path = path / ".claude" / "data" / "config.yaml"
-        if config_path.exists():
-            return path
+    while True:
+        if os.path.exists(os.path.join(current, ".claude", "data", "config.yaml")):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def load_data(path: str | Path):
+    """Load a YAML file, using the json parser when the content is plain JSON"""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    # JSON is a subset of YAML; flow-style YAML ({a: 1}) falls through
+    if data.lstrip()[:1] in (b"{", b"["):
+        try:
+            return json.loads(data)
+        except ValueError:
+            pass
+
+    # Imported by main() once the throttle has passed
+    import yaml
 
-    return None
+    # Prefer the libyaml C parser; fall back to the pure-Python one
+    return yaml.load(data, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
 
 def load_config(project_root: Path) -> dict | None:
@@ -44,13 +73,117 @@ def load_config(project_root: Path) -> dict | None:
         return None
 
     try:
-        with open(config_path) as f:
-            return yaml.safe_load(f)
+        return load_data(config_path)
     except Exception:
         return None
 
 
-def check_entity_freshness(project_root: Path, entity: str, config: dict) -> list[dict]:
+def parse_date(value) -> datetime | None:
+    """Parse an ISO date from a record field (str or YAML date)"""
+    try:
+        return datetime.fromisoformat(str(value)).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def load_cache(project_root: Path) -> dict:
+    """Load the per-file freshness cache"""
+    cache_path = project_root / ".claude" / "data" / CACHE_FILE
+
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except Exception:
+        return {}
+
+
+def save_cache(project_root: Path, cache: dict) -> None:
+    """Atomically persist the per-file freshness cache"""
+    cache_path = project_root / ".claude" / "data" / CACHE_FILE
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f, default=str)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        # Cache is an optimization only
+        pass
+
+
+def scan_partition_file(path: str, entity: str) -> list[dict]:
+    """Collect dated, still-open records from a monthly partition file"""
+    candidates = []
+
+    records = load_data(path) or []
+
+    for record in records:
+        date_str = record.get("date")
+        if date_str and parse_date(date_str):
+            status = record.get("status", "unknown")
+            if status not in EXCLUDED_STATUSES_PARTITIONED:
+                candidates.append({
+                    "entity": entity,
+                    "id": record.get("id", record.get("topic", "Unknown")),
+                    "date": str(date_str)
+                })
+
+    return candidates
+
+
+def scan_records_file(path: str, entity: str) -> list[dict]:
+    """Collect dated, still-open records from a records.yaml file"""
+    candidates = []
+
+    data = load_data(path) or {}
+
+    records = data.get("records", [])
+
+    for record in records:
+        # Get date field (could be created, date, date_created, etc.)
+        date_str = (
+            record.get("created") or
+            record.get("date") or
+            record.get("date_created") or
+            record.get("date_updated")
+        )
+
+        if not date_str or not parse_date(date_str):
+            continue
+
+        # Skip completed/archived/canceled items
+        status = (record.get("status") or "").lower()
+        if status in EXCLUDED_STATUSES:
+            continue
+
+        candidates.append({
+            "entity": entity,
+            "id": record.get("id") or record.get("number") or record.get("title", "Unknown"),
+            "title": record.get("title", ""),
+            "status": status,
+            "date": str(date_str)
+        })
+
+    return candidates
+
+
+def get_candidates(path: str, key: str, entity: str, scan, cache: dict, seen: dict) -> list[dict]:
+    """Return a file's candidate records, reusing the cache while mtime/size match"""
+    st = os.stat(path)
+    stamp = [st.st_mtime_ns, st.st_size]
+
+    entry = cache.get(key)
+    if not entry or entry.get("stamp") != stamp:
+        entry = {"stamp": stamp, "items": scan(path, entity)}
+
+    seen[key] = entry
+    return entry["items"]
+
+
+def check_entity_freshness(
+    project_root: Path, entity: str, config: dict, cache: dict, seen: dict
+) -> list[dict]:
     """Check freshness for a specific entity"""
     stale_items = []
 
@@ -60,41 +193,39 @@ def check_entity_freshness(project_root: Path, entity: str, config: dict) -> lis
 
     freshness_config = entity_config.get("freshness", {})
     stale_days = freshness_config.get("stale_after_days", 30)
-    stale_threshold = datetime.now() - timedelta(days=stale_days)
+    now = datetime.now()
+    stale_threshold = now - timedelta(days=stale_days)
 
     # Check if entity uses monthly partitioning
     partitioned = entity_config.get("partitioned") == "monthly"
 
     data_dir = project_root / ".claude" / "data" / entity
+    # Cache keys stay valid when the project is moved or cloned elsewhere
+    key_dir = f".claude/data/{entity}"
 
     if not data_dir.exists():
         return stale_items
 
+    candidates = []
+
     if partitioned:
         # Check monthly files
-        for yaml_file in data_dir.glob("*.yaml"):
-            if yaml_file.name == "schema.yaml":
-                continue
-
-            try:
-                with open(yaml_file) as f:
-                    records = yaml.safe_load(f) or []
-
-                for record in records:
-                    date_str = record.get("date")
-                    if date_str:
-                        record_date = datetime.strptime(date_str, "%Y-%m-%d")
-                        if record_date < stale_threshold:
-                            status = record.get("status", "unknown")
-                            if status not in ["archived", "completed", "done", "canceled"]:
-                                stale_items.append({
-                                    "entity": entity,
-                                    "id": record.get("id", record.get("topic", "Unknown")),
-                                    "date": date_str,
-                                    "days_old": (datetime.now() - record_date).days
-                                })
-            except Exception:
-                continue
+        with os.scandir(data_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".yaml") or entry.name == "schema.yaml":
+                    continue
+                if not entry.is_file():
+                    continue
+
+                try:
+                    candidates.extend(
+                        get_candidates(
+                            entry.path, f"{key_dir}/{entry.name}", entity,
+                            scan_partition_file, cache, seen
+                        )
+                    )
+                except Exception:
+                    continue
     else:
         # Check records.yaml
         records_path = data_dir / "records.yaml"
@@ -103,45 +234,20 @@ def check_entity_freshness(project_root: Path, entity: str, config: dict) -> lis
             return stale_items
 
         try:
-            with open(records_path) as f:
-                data = yaml.safe_load(f) or {}
-
-            records = data.get("records", [])
-
-            for record in records:
-                # Get date field (could be created, date, date_created, etc.)
-                date_str = (
-                    record.get("created") or
-                    record.get("date") or
-                    record.get("date_created") or
-                    record.get("date_updated")
+            candidates.extend(
+                get_candidates(
+                    str(records_path), f"{key_dir}/records.yaml", entity,
+                    scan_records_file, cache, seen
                 )
-
-                if not date_str:
-                    continue
-
-                try:
-                    record_date = datetime.strptime(str(date_str), "%Y-%m-%d")
-                except ValueError:
-                    continue
-
-                # Skip completed/archived/canceled items
-                status = record.get("status", "").lower()
-                if status in ["archived", "completed", "done", "canceled", "rejected", "tested", "implemented"]:
-                    continue
-
-                if record_date < stale_threshold:
-                    stale_items.append({
-                        "entity": entity,
-                        "id": record.get("id") or record.get("number") or record.get("title", "Unknown"),
-                        "title": record.get("title", ""),
-                        "status": status,
-                        "date": str(date_str),
-                        "days_old": (datetime.now() - record_date).days
-                    })
+            )
         except Exception:
             pass
 
+    for item in candidates:
+        record_date = parse_date(item["date"])
+        if record_date and record_date < stale_threshold:
+            stale_items.append({**item, "days_old": (now - record_date).days})
+
     return stale_items
 
 
@@ -149,7 +255,7 @@ def main():
     """Main hook execution"""
     # Read hook input from stdin
     try:
-        hook_input = json.loads(sys.stdin.read())
+        hook_input = json.loads(sys.stdin.buffer.read())
     except Exception:
         hook_input = {}
 
@@ -160,13 +266,28 @@ def main():
         # Not a secondbrain project, exit silently
         sys.exit(0)
 
+    # Only run full check once per hour; a single stat, no parsing
+    stamp_path = project_root / ".claude" / "data" / STAMP_FILE
+    try:
+        if time.time() - stamp_path.stat().st_mtime < CHECK_INTERVAL_SECONDS:
+            sys.exit(0)
+    except FileNotFoundError:
+        pass
+
+    # PyYAML is imported only past the throttle, so throttled runs skip it
+    try:
+        import yaml  # noqa: F401
+    except ImportError:
+        # yaml not available, skip check
+        sys.exit(0)
+
     # Load config
     config = load_config(project_root)
 
     if not config:
         sys.exit(0)
 
-    # Check last freshness check time
+    # Check last freshness check time recorded by /secondbrain-freshness
     meta = config.get("meta", {})
     last_check = meta.get("last_freshness_check")
 
@@ -181,10 +302,33 @@ def main():
 
     # Collect stale items from all entities
     all_stale = []
+    cache = load_cache(project_root)
+    seen = {}
+
+    entities = list(config.get("entities", {}).keys())
 
-    for entity in config.get("entities", {}).keys():
-        stale_items = check_entity_freshness(project_root, entity, config)
-        all_stale.extend(stale_items)
+    # Threads only overlap the stats and reads: YAML parsing holds the GIL.
+    # Imported here, below the throttle, since it pulls in logging; map()
+    # keeps config order
+    if entities:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(entities))) as executor:
+            results = executor.map(
+                lambda entity: check_entity_freshness(project_root, entity, config, cache, seen),
+                entities
+            )
+            for stale_items in results:
+                all_stale.extend(stale_items)
+
+    # Drop entries for files that no longer exist
+    if seen != cache:
+        save_cache(project_root, seen)
+
+    try:
+        stamp_path.touch()
+    except OSError:
+        pass
 
     # Sort by days_old descending
     all_stale.sort(key=lambda x: x.get("days_old", 0), reverse=True)
@@ -3,7 +3,8 @@
 Search Index Update Hook (PostToolUse Write|Edit)
 
 Incrementally updates qmd search index when docs/ files change.
-Runs qmd in background to avoid blocking the session.
+Runs qmd in background to avoid blocking the session; bursts of edits
+are collapsed into a single indexer run.
 
 Exit codes:
 - 0: Success (continue session)
@@ -11,41 +12,54 @@ Exit codes:
 
 import json
 import os
+import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 
+# Resolved once per process; None when qmd is not on PATH
+QMD_PATH = shutil.which("qmd")
+
+# Debounce state, kept next to the index in .claude/search/
+PENDING_FILE = ".pending"
+PID_FILE = ".qmd.pid"
+DEBOUNCE_SECONDS = 0.5
+STALE_LOCK_SECONDS = 60
+# The indexer refreshes the lock before every qmd run; an older lock is
+# stale even if its pid is alive (reused after a reboot or kill)
+MAX_INDEX_SECONDS = 600
+
 
 def find_project_root() -> Path | None:
     """Find the project root by looking for .claude/data/config.yaml"""
-    cwd = Path.cwd()
+    current = os.getcwd()
 
-    for path in [cwd] + list(cwd.parents):
-        config_path = path / ".claude" / "data" / "config.yaml"
-        if config_path.exists():
-            return path
-
-    return None
+    # Check current directory and parents
+    while True:
+        if os.path.exists(os.path.join(current, ".claude", "data", "config.yaml")):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
 
 
 def is_search_initialized(project_root: Path) -> bool:
     """Check if search index exists"""
     search_dir = project_root / ".claude" / "search"
-    return search_dir.exists() and any(search_dir.iterdir())
+
+    try:
+        with os.scandir(search_dir) as entries:
+            next(entries)
+        return True
+    except (StopIteration, FileNotFoundError, NotADirectoryError):
+        return False
 
 
 def is_qmd_installed() -> bool:
     """Check if qmd is available"""
-    try:
-        result = subprocess.run(
-            ["which", "qmd"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        return result.returncode == 0
-    except Exception:
-        return False
+    return QMD_PATH is not None
 
 
 def is_docs_file(file_path: str, project_root: Path) -> bool:
@@ -79,18 +93,97 @@ def should_skip_file(file_path: str) -> bool:
     return False
 
 
+def is_indexer_running(pid_path: Path) -> bool:
+    """Check if the indexer recorded in the pid file is still alive"""
+    try:
+        age = time.time() - pid_path.stat().st_mtime
+        pid = int(pid_path.read_text().strip())
+    except FileNotFoundError:
+        return False
+    except ValueError:
+        # Lock was just taken and the pid is not written yet
+        return age < STALE_LOCK_SECONDS
+
+    if age >= MAX_INDEX_SECONDS:
+        return False
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+
+    return True
+
+
+def spawn_detached(args: list[str], project_root: Path) -> subprocess.Popen:
+    """Start a process that outlives the hook, with output discarded"""
+    # Using Popen to not block
+    return subprocess.Popen(
+        args,
+        cwd=str(project_root),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True  # Detach from parent process
+    )
+
+
 def update_index_background(project_root: Path, file_path: str) -> None:
-    """Trigger incremental qmd index update in background"""
+    """Queue the change and start one debounced qmd index update in background"""
+    search_dir = project_root / ".claude" / "search"
+    pending_path = search_dir / PENDING_FILE
+    pid_path = search_dir / PID_FILE
+
     try:
-        # Run qmd update in background
-        # Using Popen to not block
-        subprocess.Popen(
-            ["qmd", "index", "--incremental"],
-            cwd=str(project_root),
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True  # Detach from parent process
+        # Record the change; a running indexer re-runs while this file exists
+        fd = os.open(pending_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, (file_path + "\n").encode())
+        finally:
+            os.close(fd)
+
+        try:
+            lock = os.open(pid_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            if is_indexer_running(pid_path):
+                # Indexer already scheduled, it will pick this edit up
+                return
+            # Lock left behind by an indexer that was killed
+            pid_path.unlink(missing_ok=True)
+            lock = os.open(pid_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+
+        # Wait for the edit burst to settle, then index until no new changes
+        # arrived during the previous run. An edit landing just before the
+        # lock is released saw it held and left the work to this indexer,
+        # so re-check after releasing and take the lock back (unless that
+        # edit's hook already did)
+        script = (
+            f"sleep {DEBOUNCE_SECONDS}; "
+            "while :; do "
+            'while [ -e "$1" ]; do rm -f "$1"; echo $$ > "$3"; "$2" index --incremental; done; '
+            'rm -f "$3"; '
+            '[ -e "$1" ] && (set -C; echo $$ > "$3") 2>/dev/null || break; '
+            "done"
         )
+        try:
+            process = spawn_detached(
+                ["sh", "-c", script, "sh", str(pending_path), QMD_PATH, str(pid_path)],
+                project_root
+            )
+        except Exception:
+            # Don't leave a lock behind that no indexer will release
+            os.close(lock)
+            pid_path.unlink(missing_ok=True)
+            # No usable sh: index this edit directly, without debouncing
+            pending_path.unlink(missing_ok=True)
+            spawn_detached([QMD_PATH, "index", "--incremental"], project_root)
+            return
+
+        try:
+            os.write(lock, str(process.pid).encode())
+        finally:
+            os.close(lock)
     except Exception:
         # Silently fail - search index update is non-critical
         pass
@@ -100,7 +193,7 @@ def main():
     """Main hook execution"""
     # Read hook input from stdin
     try:
-        hook_input = json.loads(sys.stdin.read())
+        hook_input = json.loads(sys.stdin.buffer.read())
     except Exception:
         hook_input = {}
 
@@ -11,26 +11,41 @@ Exit codes:
 
 import json
 import os
+import re
 import sys
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 
-try:
-    import yaml
-except ImportError:
-    sys.exit(0)
+# Statuses that do not count as active
+EXCLUDED_STATUSES_PARTITIONED = frozenset({"archived", "canceled"})
+EXCLUDED_STATUSES = frozenset({"archived", "completed", "done", "canceled", "rejected"})
+
+# Monthly shard files; meta.yaml and schema.yaml sit next to them
+PARTITION_RE = re.compile(r"\d{4}-\d{2}\.yaml")
 
 
 def find_project_root() -> Path | None:
     """Find the project root by looking for .claude/data/config.yaml"""
-    cwd = Path.cwd()
+    current = os.getcwd()
 
-    for path in [cwd] + list(cwd.parents):
-        config_path = path / ".claude" / "data" / "config.yaml"
-        if config_path.exists():
-            return path
+    # Check current directory and parents
+    while True:
+        if os.path.exists(os.path.join(current, ".claude", "data", "config.yaml")):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
 
-    return None
+
+def load_yaml(stream):
+    """Parse YAML, importing PyYAML only once a project has been found"""
+    # Raises ImportError without PyYAML; callers treat that as "no data"
+    import yaml
+
+    # Prefer the libyaml C parser; fall back to the pure-Python one
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
 
 def load_config(project_root: Path) -> dict | None:
@@ -41,59 +56,192 @@ def load_config(project_root: Path) -> dict | None:
         return None
 
     try:
-        with open(config_path) as f:
-            return yaml.safe_load(f)
+        with open(config_path, "rb") as f:
+            return load_yaml(f)
     except Exception:
         return None
 
 
-def count_entity_records(project_root: Path, entity: str, config: dict) -> dict:
-    """Count records for an entity"""
-    entity_config = config.get("entities", {}).get(entity, {})
+def list_partitions(data_dir: Path) -> dict[str, str]:
+    """Map an entity's monthly partition file names to their paths"""
+    with os.scandir(data_dir) as entries:
+        return {
+            entry.name: entry.path
+            for entry in entries
+            if PARTITION_RE.fullmatch(entry.name)
+        }
 
-    if not entity_config.get("enabled", False):
-        return {"total": 0, "active": 0}
 
-    partitioned = entity_config.get("partitioned") == "monthly"
-    data_dir = project_root / ".claude" / "data" / entity
+def load_partition(path: str) -> list | None:
+    """Load one monthly partition; None if it can't be read or parsed"""
+    try:
+        with open(path, "rb") as f:
+            return load_yaml(f) or []
+    except Exception:
+        return None
+
 
-    if not data_dir.exists():
-        return {"total": 0, "active": 0}
+def load_entity_records(data_dir: Path) -> list:
+    """Load the records of a non-partitioned entity"""
+    records_path = data_dir / "records.yaml"
+    if records_path.exists():
+        try:
+            with open(records_path, "rb") as f:
+                data = load_yaml(f) or {}
+            return data.get("records", [])
+        except Exception:
+            pass
 
+    return []
+
+
+def count_records(records: list, excluded: frozenset) -> tuple[int, int]:
+    """Count (total, active) in a list of loaded records"""
     total = 0
     active = 0
 
-    if partitioned:
-        for yaml_file in data_dir.glob("*.yaml"):
-            if yaml_file.name == "schema.yaml":
-                continue
+    try:
+        total += len(records)
+        for r in records:
+            status = (r.get("status") or "").lower()
+            if status not in excluded:
+                active += 1
+    except Exception:
+        pass
+
+    return total, active
+
+
+def count_partition_stream(path: str, excluded: frozenset) -> tuple[int, int] | None:
+    """Count (total, active) from parser events, without building the records
+
+    Only a plain list of mappings with string (or null) statuses is counted
+    this way. Scalars whose construction can fail (timestamps, explicit
+    tags) are still built and discarded, so a file the loader rejects is
+    rejected here too. Anything else (aliases, merge keys, unknown tags,
+    complex keys, several documents, parse errors) returns None so the
+    caller loads the file as before.
+    """
+    try:
+        import yaml
+
+        str_tag = "tag:yaml.org,2002:str"
+        null_tag = "tag:yaml.org,2002:null"
+        merge_tag = "tag:yaml.org,2002:merge"
+        # Implicitly resolved scalars of these types always construct
+        plain_tags = frozenset({
+            str_tag, null_tag, "tag:yaml.org,2002:bool",
+            "tag:yaml.org,2002:int", "tag:yaml.org,2002:float",
+        })
+        collection_tags = frozenset({None, "!", "tag:yaml.org,2002:seq", "tag:yaml.org,2002:map"})
+
+        total = 0
+        active = 0
+        documents = 0
+        # One [is_mapping, expect_key] entry per open collection; the
+        # top-level list is stack[0] and the current record stack[1]
+        stack = []
+        key = None
+        status = ""
+
+        with open(path, "rb") as f:
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)(f)
+            constructors = loader.yaml_constructors
             try:
-                with open(yaml_file) as f:
-                    records = yaml.safe_load(f) or []
-                total += len(records)
-                # For partitioned, count non-archived
-                for r in records:
-                    status = r.get("status", "").lower()
-                    if status not in ["archived", "canceled"]:
-                        active += 1
-            except Exception:
+                while loader.check_event():
+                    event = loader.get_event()
+
+                    if isinstance(event, (yaml.ScalarEvent, yaml.CollectionStartEvent)):
+                        depth = len(stack)
+                        is_key = False
+                        if stack and stack[-1][0]:
+                            is_key = stack[-1][1]
+                            stack[-1][1] = not is_key
+
+                        if isinstance(event, yaml.ScalarEvent):
+                            if depth < 2:
+                                # Top-level or list-item scalars
+                                return None
+                            explicit = event.tag not in (None, "!")
+                            if explicit:
+                                tag = event.tag
+                            else:
+                                tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+                            if tag == merge_tag:
+                                return None
+                            if explicit or tag not in plain_tags:
+                                constructor = constructors.get(tag)
+                                if constructor is None:
+                                    return None
+                                # Raises like a full load would
+                                constructor(loader, yaml.ScalarNode(tag, event.value))
+
+                            if depth == 2:
+                                if is_key:
+                                    key = event.value if tag == str_tag else None
+                                elif key == "status":
+                                    if tag == null_tag:
+                                        status = ""
+                                    elif tag == str_tag:
+                                        status = event.value.lower()
+                                    else:
+                                        return None
+                        else:
+                            if is_key or event.tag not in collection_tags:
+                                # Complex key, or a tagged collection
+                                return None
+                            is_mapping = isinstance(event, yaml.MappingStartEvent)
+                            if depth == 0 and is_mapping:
+                                return None
+                            if depth == 1:
+                                if not is_mapping:
+                                    return None
+                                total += 1
+                                status = ""
+                            elif depth == 2 and key == "status":
+                                # Status that is not a string
+                                return None
+                            stack.append([is_mapping, True])
+                    elif isinstance(event, yaml.CollectionEndEvent):
+                        stack.pop()
+                        if len(stack) == 1 and status not in excluded:
+                            active += 1
+                    elif isinstance(event, yaml.AliasEvent):
+                        return None
+                    elif isinstance(event, yaml.DocumentStartEvent):
+                        documents += 1
+                        if documents > 1:
+                            return None
+            finally:
+                loader.dispose()
+
+        return total, active
+    except Exception:
+        return None
+
+
+def count_partition_records(partitions: dict[str, str], loaded: dict[str, list | None]) -> tuple[int, int]:
+    """Count (total, active) across partitions, streaming the ones not loaded yet"""
+    total = 0
+    active = 0
+
+    for name, path in partitions.items():
+        counts = None
+        if name not in loaded:
+            counts = count_partition_stream(path, EXCLUDED_STATUSES_PARTITIONED)
+            if counts is None:
+                loaded[name] = load_partition(path)
+
+        if counts is None:
+            records = loaded[name]
+            if records is None:
                 continue
-    else:
-        records_path = data_dir / "records.yaml"
-        if records_path.exists():
-            try:
-                with open(records_path) as f:
-                    data = yaml.safe_load(f) or {}
-                records = data.get("records", [])
-                total = len(records)
-                for r in records:
-                    status = r.get("status", "").lower()
-                    if status not in ["archived", "completed", "done", "canceled", "rejected"]:
-                        active += 1
-            except Exception:
-                pass
+            counts = count_records(records, EXCLUDED_STATUSES_PARTITIONED)
 
-    return {"total": total, "active": active}
+        total += counts[0]
+        active += counts[1]
+
+    return total, active
 
 
 def get_search_status(project_root: Path) -> dict | None:
@@ -129,72 +277,56 @@ def get_search_status(project_root: Path) -> dict | None:
         return {"status": "ready", "updated": "unknown"}
 
 
-def get_recent_activity(project_root: Path, config: dict) -> list[str]:
-    """Get recent activity summary"""
-    activities = []
+def get_recent_partition_record(
+    partitions: dict[str, str], loaded: dict[str, list | None]
+) -> tuple[dict, str] | None:
+    """Get a partitioned entity's most recent record and its date
 
-    for entity, entity_config in config.get("entities", {}).items():
-        if not entity_config.get("enabled", False):
+    Partitions are loaded on demand and kept in loaded for counting.
+    """
+    # Month files (YYYY-MM.yaml) order by name; try the newest one and
+    # only sort the older months if it has no dated record
+    latest = max(partitions, default=None)
+    if latest is None:
+        return None
+    older = (name for name in sorted(partitions, reverse=True) if name != latest)
+    for name in chain([latest], older):
+        if name not in loaded:
+            loaded[name] = load_partition(partitions[name])
+        records = loaded[name]
+        if records is None:
             continue
-
-        data_dir = project_root / ".claude" / "data" / entity
-        if not data_dir.exists():
+        try:
+            r = max(records, key=lambda x: x.get("date", ""), default=None)
+            date_str = r.get("date") if r else None
+            if date_str:
+                return r, date_str
+        except Exception:
             continue
 
-        # Get most recent record
-        most_recent = None
-        most_recent_date = None
-
-        partitioned = entity_config.get("partitioned") == "monthly"
-
-        if partitioned:
-            yaml_files = sorted(data_dir.glob("*.yaml"), reverse=True)
-            for yaml_file in yaml_files:
-                if yaml_file.name == "schema.yaml":
-                    continue
-                try:
-                    with open(yaml_file) as f:
-                        records = yaml.safe_load(f) or []
-                    if records:
-                        for r in sorted(records, key=lambda x: x.get("date", ""), reverse=True):
-                            date_str = r.get("date")
-                            if date_str:
-                                most_recent = r
-                                most_recent_date = date_str
-                                break
-                    if most_recent:
-                        break
-                except Exception:
-                    continue
-        else:
-            records_path = data_dir / "records.yaml"
-            if records_path.exists():
-                try:
-                    with open(records_path) as f:
-                        data = yaml.safe_load(f) or {}
-                    records = data.get("records", [])
-                    if records:
-                        # Sort by created date descending
-                        sorted_records = sorted(
-                            records,
-                            key=lambda x: x.get("created") or x.get("date_created") or "",
-                            reverse=True
-                        )
-                        if sorted_records:
-                            most_recent = sorted_records[0]
-                            most_recent_date = (
-                                most_recent.get("created") or
-                                most_recent.get("date_created")
-                            )
-                except Exception:
-                    pass
-
-        if most_recent and most_recent_date:
-            singular = entity_config.get("singular", entity.rstrip("s"))
-            title = most_recent.get("title") or most_recent.get("topic") or most_recent.get("id", "")
-            activities.append(f"- Last {singular}: \"{title}\" ({most_recent_date})")
+    return None
 
-    return activities[:5]  # Limit to 5 most recent
+
+def get_recent_record(records: list) -> tuple[dict, str] | None:
+    """Get a non-partitioned entity's most recent record and its date"""
+    try:
+        # Latest by created date
+        most_recent = max(
+            records,
+            key=lambda x: x.get("created") or x.get("date_created") or "",
+            default=None
+        )
+        if most_recent:
+            most_recent_date = (
+                most_recent.get("created") or
+                most_recent.get("date_created")
+            )
+            if most_recent_date:
+                return most_recent, most_recent_date
+    except Exception:
+        pass
+
+    return None
 
 
 def main():
@@ -211,12 +343,41 @@ def main():
 
     project_name = config.get("project", {}).get("name", "Secondbrain")
 
-    # Count records per entity
+    # Resolved once: (name, config, singular label) per enabled entity
+    enabled_entities = [
+        (entity, entity_config, entity_config.get("singular", entity.rstrip("s")))
+        for entity, entity_config in config.get("entities", {}).items()
+        if entity_config.get("enabled", False)
+    ]
+
+    # Load each entity once; counts and recent activity share the records
+    data_root = project_root / ".claude" / "data"
     entity_stats = {}
-    for entity in config.get("entities", {}).keys():
-        stats = count_entity_records(project_root, entity, config)
-        if stats["total"] > 0:
-            entity_stats[entity] = stats
+    activities = []
+    for entity, entity_config, singular in enabled_entities:
+        data_dir = data_root / entity
+        if not data_dir.exists():
+            continue
+
+        if entity_config.get("partitioned") == "monthly":
+            # Only the months needed for recent activity are loaded; the
+            # rest are counted from parser events
+            partitions = list_partitions(data_dir)
+            loaded = {}
+            recent = get_recent_partition_record(partitions, loaded)
+            total, active = count_partition_records(partitions, loaded)
+        else:
+            records = load_entity_records(data_dir)
+            recent = get_recent_record(records)
+            total, active = count_records(records, EXCLUDED_STATUSES)
+
+        if total > 0:
+            entity_stats[entity] = {"total": total, "active": active}
+
+        if recent:
+            most_recent, most_recent_date = recent
+            title = most_recent.get("title") or most_recent.get("topic") or most_recent.get("id", "")
+            activities.append(f"- Last {singular}: \"{title}\" ({most_recent_date})")
 
     # Build context message
     lines = [
@@ -227,8 +388,6 @@ def main():
     if entity_stats:
         lines.append("**Records:**")
         for entity, stats in entity_stats.items():
-            entity_config = config.get("entities", {}).get(entity, {})
-            singular = entity_config.get("singular", entity.rstrip("s"))
             if stats["active"] < stats["total"]:
                 lines.append(f"- {entity.title()}: {stats['active']} active / {stats['total']} total")
             else:
@@ -242,10 +401,9 @@ def main():
         lines.append("")
 
     # Recent activity
-    activities = get_recent_activity(project_root, config)
     if activities:
         lines.append("**Recent:**")
-        lines.extend(activities)
+        lines.extend(activities[:5])  # Limit to 5 most recent
         lines.append("")
 
     # Available skills - include conditional ones
@@ -265,10 +423,12 @@ def main():
         skills.append("`/secondbrain-transcribe`")
     lines.append(f"**Available:** {', '.join(skills)}")
 
-    print(json.dumps({
+    # Compact and unescaped; encoded explicitly so a non-UTF-8 locale can't fail
+    output = json.dumps({
         "result": "continue",
         "message": "\n".join(lines)
-    }))
+    }, ensure_ascii=False, separators=(",", ":"))
+    sys.stdout.buffer.write(output.encode("utf-8") + b"\n")
 
     sys.exit(0)
 
@@ -10,27 +10,25 @@ Exit codes:
 """
 
 import json
+import mmap
 import os
 import re
 import sys
 from pathlib import Path
 
-try:
-    import yaml
-except ImportError:
-    sys.exit(0)
-
 
 def find_project_root() -> Path | None:
     """Find the project root by looking for .claude/data/config.yaml"""
-    cwd = Path.cwd()
+    current = os.getcwd()
 
-    for path in [cwd] + list(cwd.parents):
-        config_path = path / ".claude" / "data" / "config.yaml"
-        if config_path.exists():
-            return path
-
-    return None
+    # Check current directory and parents
+    while True:
+        if os.path.exists(os.path.join(current, ".claude", "data", "config.yaml")):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
 
 
 def get_tool_output(hook_input: dict) -> dict | None:
@@ -78,44 +76,39 @@ def check_sidebar_contains_link(config_path: Path, link: str) -> bool:
     if not config_path.exists():
         return True  # No config, can't check
 
-    try:
-        content = config_path.read_text()
-
-        # Simple check: look for the link in the config
-        # Handle both with and without trailing slash
-        link_patterns = [
-            f"'{link}'",
-            f'"{link}"',
-            f"'{link}/'",
-            f'"{link}/"',
-        ]
-
-        for pattern in link_patterns:
-            if pattern in content:
-                return True
-
-        # Also check for the path without leading slash
-        link_no_slash = link.lstrip("/")
-        additional_patterns = [
-            f"'{link_no_slash}'",
-            f'"{link_no_slash}"',
-        ]
-
-        for pattern in additional_patterns:
-            if pattern in content:
-                return True
+    # Simple check: look for the link in the config
+    # Handle both with and without trailing slash, and
+    # also the path without leading slash
+    link_no_slash = link.lstrip("/")
+    link_patterns = [
+        f"'{link}'",
+        f'"{link}"',
+        f"'{link}/'",
+        f'"{link}/"',
+        f"'{link_no_slash}'",
+        f'"{link_no_slash}"',
+    ]
+
+    # One scan of the file for all variants
+    link_re = re.compile(b"|".join(re.escape(pattern.encode()) for pattern in link_patterns))
 
+    try:
+        with open(config_path, "rb") as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            # Search the page-cache mapping directly, no copy or decode
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return link_re.search(content) is not None
     except Exception:
         return True  # Can't read, assume OK
 
-    return False
-
 
 def main():
     """Main hook execution"""
     # Read hook input from stdin
     try:
-        hook_input = json.loads(sys.stdin.read())
+        hook_input = json.loads(sys.stdin.buffer.read())
     except Exception:
         hook_input = {}
 
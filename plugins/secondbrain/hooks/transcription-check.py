@@ -8,6 +8,7 @@ Exit: 0 (always — inject context, never block)
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -19,12 +20,16 @@ except ImportError:
 
 def find_project_root() -> Path | None:
     """Find the project root by looking for .claude/data/config.yaml"""
-    cwd = Path.cwd()
-    for path in [cwd] + list(cwd.parents):
-        config_path = path / ".claude" / "data" / "config.yaml"
-        if config_path.exists():
-            return path
-    return None
+    current = os.getcwd()
+
+    # Check current directory and parents
+    while True:
+        if os.path.exists(os.path.join(current, ".claude", "data", "config.yaml")):
+            return Path(current)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
 
 
 def main():
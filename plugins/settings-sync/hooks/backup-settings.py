@@ -6,10 +6,13 @@ Triggers: When Claude attempts to stop
 Action: Copy ~/.claude settings to .claude-backup/ in the repo
 """
 
+import fnmatch
 import json
 import os
+import re
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Files/dirs to backup (relative to ~/.claude)
@@ -31,6 +34,9 @@ EXCLUDE_PATTERNS = [
     "secret*",
 ]
 
+# All patterns as one anchored regex, matched against lowercased names
+EXCLUDE_RE = re.compile("|".join(fnmatch.translate(p) for p in EXCLUDE_PATTERNS))
+
 
 def get_backup_dir():
     """Get the .claude-backup directory in the repo."""
@@ -46,19 +52,86 @@ def get_claude_dir():
     return Path.home() / ".claude"
 
 
+def is_excluded_name(name: str) -> bool:
+    """Check if a file name matches an exclude pattern."""
+    return EXCLUDE_RE.match(name.lower()) is not None
+
+
 def should_exclude(path: Path) -> bool:
     """Check if a file should be excluded from backup."""
-    name = path.name.lower()
-    for pattern in EXCLUDE_PATTERNS:
-        if pattern.startswith("*"):
-            if name.endswith(pattern[1:]):
-                return True
-        elif pattern.endswith("*"):
-            if name.startswith(pattern[:-1]):
-                return True
-        elif name == pattern:
-            return True
-    return False
+    return is_excluded_name(path.name)
+
+
+def remove_entry(entry: os.DirEntry):
+    """Remove a file, symlink or directory found by os.scandir."""
+    if entry.is_dir(follow_symlinks=False):
+        shutil.rmtree(entry.path)
+    else:
+        os.unlink(entry.path)
+
+
+def sync_tree(source: Path, dest: Path):
+    """Mirror a directory, copying only files whose size or mtime changed."""
+    if dest.is_symlink() or dest.is_file():
+        dest.unlink()
+    dest.mkdir(parents=True, exist_ok=True)
+
+    # Walk serially (creates directories, removes stale entries), then copy
+    # changed files concurrently; copy2 releases the GIL while copying
+    copies = []
+    sync_dir(str(source), str(dest), copies)
+
+    if len(copies) == 1:
+        shutil.copy2(*copies[0])
+    elif copies:
+        workers = min(32, (os.cpu_count() or 1) * 4, len(copies))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # list() re-raises the first copy error, as copytree did
+            list(executor.map(lambda job: shutil.copy2(*job), copies))
+
+
+def sync_dir(source: str, dest: str, copies: list):
+    """Sync into an existing destination directory.
+
+    Entry types come from the two os.scandir listings, so recursing only
+    costs a stat per file pair and a mkdir for new directories. Files that
+    need copying are appended to copies as (source, target) pairs.
+    """
+    # One listing of the destination; whatever is left over is stale
+    with os.scandir(dest) as entries:
+        existing = {entry.name: entry for entry in entries}
+
+    with os.scandir(source) as entries:
+        for entry in entries:
+            if is_excluded_name(entry.name):
+                continue
+
+            target = os.path.join(dest, entry.name)
+            current = existing.pop(entry.name, None)
+
+            if entry.is_dir():
+                if current is not None and not current.is_dir(follow_symlinks=False):
+                    remove_entry(current)
+                    current = None
+                if current is None:
+                    os.mkdir(target)
+                sync_dir(entry.path, target, copies)
+            elif entry.is_file():
+                if current is not None:
+                    if current.is_dir(follow_symlinks=False):
+                        remove_entry(current)
+                    else:
+                        # copy2 preserves mtime, so unchanged files match exactly
+                        src_stat = entry.stat()
+                        dst_stat = current.stat(follow_symlinks=False)
+                        if (dst_stat.st_size == src_stat.st_size and
+                                dst_stat.st_mtime_ns == src_stat.st_mtime_ns):
+                            continue
+                copies.append((entry.path, target))
+
+    # Deleted or newly excluded in the source
+    for entry in existing.values():
+        remove_entry(entry)
 
 
 def backup_item(source: Path, dest: Path):
@@ -74,19 +147,8 @@ def backup_item(source: Path, dest: Path):
         return True
 
     elif source.is_dir():
-        # Remove existing backup dir
-        if dest.exists():
-            shutil.rmtree(dest)
-
-        # Copy directory, excluding sensitive files
-        def ignore_func(directory, files):
-            ignored = []
-            for f in files:
-                if should_exclude(Path(directory) / f):
-                    ignored.append(f)
-            return ignored
-
-        shutil.copytree(source, dest, ignore=ignore_func)
+        # Sync directory incrementally, excluding sensitive files
+        sync_tree(source, dest)
         return True
 
     return False
@@ -95,9 +157,9 @@ def backup_item(source: Path, dest: Path):
 def main():
     """Main hook entry point."""
     try:
-        # Read input (required for hook protocol)
-        json.load(sys.stdin)
-    except json.JSONDecodeError:
+        # Drain input (required for hook protocol); the payload is unused
+        sys.stdin.buffer.read()
+    except Exception:
         pass
 
     backup_dir = get_backup_dir()
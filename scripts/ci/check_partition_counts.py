@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Check that session-context's streamed partition counts match a full load.
+
+count_partition_stream() counts records from YAML parser events instead of
+loading the file. For every sample below it must either return the same
+(total, active) as loading the file and counting it, or return None so the
+hook falls back to the load. A file the loader rejects must never get a
+streamed count.
+
+Exits 0 on success, 1 if any sample diverges.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import tempfile
+import typing
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+HOOK = ROOT / "plugins" / "secondbrain" / "hooks" / "session-context.py"
+
+SAMPLES = {
+    "plain": "- {status: open}\n- {status: Archived}\n- {topic: x}\n- status: ~\n",
+    "nested": (
+        "- topic: a\n  participants: [a, b]\n  meta: {status: archived}\n"
+        "  status: canceled\n- {status: 'ARCHIVED'}\n"
+    ),
+    "dates": "- {date: 2024-01-05, status: open}\n- {date: 2024-02-29 10:00:00}\n",
+    "invalid date": "- {date: 2024-13-45, status: open}\n- {status: archived}\n",
+    "nested invalid date": "- {meta: {when: [2024-13-45]}, status: open}\n",
+    "unknown tag": "- {status: open, x: !bar 1}\n",
+    "bad explicit int": "- {status: open, n: !!int abc}\n",
+    "binary": "- {status: open, b: !!binary aGVsbG8=}\n",
+    "tagged status": "- {status: !!str archived}\n",
+    "tagged collection": "- {status: open, s: !!set {a: null}}\n",
+    "int status": "- {status: 5}\n",
+    "date status": "- {status: 2024-01-01}\n",
+    "list status": "- {status: [a]}\n",
+    "alias": "- &a {status: archived}\n- *a\n",
+    "merge alias": "- &a {status: archived}\n- {<<: *a}\n",
+    "merge inline": "- <<: {status: archived}\n- {status: open}\n",
+    "nested merge": "- {status: open, m: {<<: {a: 1}}}\n",
+    "complex key": "- {status: open, ? [a] : b}\n",
+    "nested complex key": "- {status: open, m: {? {a: 1} : b}}\n",
+    "duplicate key": "- {status: archived, status: open}\n",
+    "quoted key": "- {'status': archived}\n",
+    "empty": "",
+    "null document": "~\n",
+    "mapping document": "a: 1\n",
+    "scalar items": "- a\n- {status: x}\n",
+    "parse error": "- {status: [\n",
+    "several documents": "- {status: open}\n---\n- {status: x}\n",
+}
+
+
+def die(msg: str) -> "typing.NoReturn":
+    sys.stderr.write(f"FAIL: {msg}\n")
+    sys.exit(1)
+
+
+def load_hook():
+    spec = importlib.util.spec_from_file_location("session_context", HOOK)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main() -> None:
+    hook = load_hook()
+    excluded = hook.EXCLUDED_STATUSES_PARTITIONED
+
+    fail = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, text in SAMPLES.items():
+            path = Path(tmp) / "2024-01.yaml"
+            path.write_text(text)
+
+            streamed = hook.count_partition_stream(str(path), excluded)
+            records = hook.load_partition(str(path))
+            expected = (
+                None if records is None else hook.count_records(records, excluded)
+            )
+
+            if streamed is not None and streamed != expected:
+                sys.stderr.write(
+                    f"FAIL: {name}: streamed {streamed}, full load gives {expected}\n"
+                )
+                fail += 1
+
+    if fail:
+        die(f"{fail} of {len(SAMPLES)} sample(s) diverge from a full load")
+    print(f"{len(SAMPLES)} partition sample(s) match a full load.")
+
+
+if __name__ == "__main__":
+    main()